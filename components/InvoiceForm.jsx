@@ -401,6 +401,7 @@ function InvoiceForm({ data, onConfirm, onCancel }) {
             </label>
             <input
               type="text"
+              name="invoice_id"
               value={formData.InvoiceId}
               onChange={(e) => handleFieldChange('InvoiceId', e.target.value)}
               className={`w-full px-4 py-2 border rounded-md focus:ring-2 focus:ring-primary-500 focus:border-primary-500 ${
@@ -417,6 +418,7 @@ function InvoiceForm({ data, onConfirm, onCancel }) {
             </label>
             <input
               type="text"
+              name="customer_name"
               value={formData.VendorName}
               onChange={(e) => handleFieldChange('VendorName', e.target.value)}
               className={`w-full px-4 py-2 border rounded-md focus:ring-2 focus:ring-primary-500 focus:border-primary-500 ${
@@ -433,6 +435,7 @@ function InvoiceForm({ data, onConfirm, onCancel }) {
             </label>
             <input
               type="text"
+              name="company_name"
               value={formData.CompanyName}
               onChange={(e) => handleFieldChange('CompanyName', e.target.value)}
               className={`w-full px-4 py-2 border rounded-md focus:ring-2 focus:ring-primary-500 focus:border-primary-500 ${
@@ -449,6 +452,7 @@ function InvoiceForm({ data, onConfirm, onCancel }) {
             </label>
             <input
               type="text"
+              name="currency"
               value={formData.Currency}
               readOnly
               disabled
@@ -469,6 +473,7 @@ function InvoiceForm({ data, onConfirm, onCancel }) {
             </label>
             <input
               type="date"
+              name="invoice_date"
               value={formData.InvoiceDate}
               onChange={(e) => handleFieldChange('InvoiceDate', e.target.value)}
               className={`w-full px-4 py-2 border rounded-md focus:ring-2 focus:ring-primary-500 focus:border-primary-500 ${
@@ -484,6 +489,7 @@ function InvoiceForm({ data, onConfirm, onCancel }) {
             </label>
             <input
               type="date"
+              name="due_date"
               value={formData.DueDate}
               onChange={(e) => handleFieldChange('DueDate', e.target.value)}
               className={`w-full px-4 py-2 border rounded-md focus:ring-2 focus:ring-primary-500 focus:border-primary-500 ${
@@ -500,6 +506,7 @@ function InvoiceForm({ data, onConfirm, onCancel }) {
             </label>
             <input
               type="text"
+              name="billing_address_recipient"
               value={formData.BillingAddressRecipient}
               onChange={(e) => handleFieldChange('BillingAddressRecipient', e.target.value)}
               className="w-full px-4 py-2 border border-gray-300 rounded-md focus:ring-2 focus:ring-primary-500 focus:border-primary-500"
@@ -514,6 +521,7 @@ function InvoiceForm({ data, onConfirm, onCancel }) {
             </label>
             <input
               type="text"
+              name="shipping_address"
               value={formData.ShippingAddress}
               onChange={(e) => handleFieldChange('ShippingAddress', e.target.value)}
               className="w-full px-4 py-2 border border-gray-300 rounded-md focus:ring-2 focus:ring-primary-500 focus:border-primary-500"
@@ -529,6 +537,7 @@ function InvoiceForm({ data, onConfirm, onCancel }) {
             <input
               type="number"
               step="0.01"
+              name="subtotal"
               value={formData.SubTotal}
               readOnly
               disabled
@@ -545,6 +554,7 @@ function InvoiceForm({ data, onConfirm, onCancel }) {
             <input
               type="number"
               step="0.01"
+              name="shipping_cost"
               value={formData.ShippingCost}
               onChange={(e) => handleFieldChangeWithTotal('ShippingCost', e.target.value)}
               className="w-full px-4 py-2 border border-gray-300 rounded-md focus:ring-2 focus:ring-primary-500 focus:border-primary-500"
@@ -559,6 +569,7 @@ function InvoiceForm({ data, onConfirm, onCancel }) {
             <input
               type="number"
               step="0.01"
+              name="tax"
               value={formData.Tax || ''}
               onChange={(e) => handleFieldChangeWithTotal('Tax', e.target.value)}
               className={`w-full px-4 py-2 border rounded-md focus:ring-2 focus:ring-primary-500 focus:border-primary-500 ${
@@ -579,6 +590,7 @@ function InvoiceForm({ data, onConfirm, onCancel }) {
             <input
               type="number"
               step="0.01"
+              name="invoice_total"
               value={formData.InvoiceTotal}
               readOnly
               disabled
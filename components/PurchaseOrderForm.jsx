@@ -303,6 +303,7 @@ function PurchaseOrderForm({ data, onConfirm, onCancel }) {
             </label>
             <input
               type="text"
+              name="supplier_name"
               value={formData.supplier_name}
               onChange={(e) => handleFieldChange('supplier_name', e.target.value)}
               disabled={isSubmitting}
@@ -320,6 +321,7 @@ function PurchaseOrderForm({ data, onConfirm, onCancel }) {
             </label>
             <input
               type="text"
+              name="company_name"
               value={formData.company_name}
               onChange={(e) => handleFieldChange('company_name', e.target.value)}
               disabled={isSubmitting}
@@ -337,6 +339,7 @@ function PurchaseOrderForm({ data, onConfirm, onCancel }) {
             </label>
             <input
               type="date"
+              name="order_date"
               value={formData.date}
               onChange={(e) => handleFieldChange('date', e.target.value)}
               disabled={isSubmitting}
@@ -353,6 +356,7 @@ function PurchaseOrderForm({ data, onConfirm, onCancel }) {
             </label>
             <input
               type="date"
+              name="delivery_date"
               value={formData.delivery_date || ''}
               onChange={(e) => handleFieldChange('delivery_date', e.target.value)}
               disabled={isSubmitting}
@@ -368,6 +372,7 @@ function PurchaseOrderForm({ data, onConfirm, onCancel }) {
               Currency <span className="text-red-500">*</span>
             </label>
             <select
+              name="currency"
               value={formData.currency || 'USD'}
               onChange={(e) => handleFieldChange('currency', e.target.value)}
               disabled={isSubmitting}
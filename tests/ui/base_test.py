@@ -1,35 +1,154 @@
 """Base test class for UI tests using Playwright and unittest.
 
-Tests use real backend API at localhost:8000 - no mocking.
+Happy-flow tests use the real backend API at localhost:8000. Validation tests
+stub /upload/* per page with stub_upload, since they only exercise
+client-side checks.
+
+Set VCR_MODE=cache to record upload responses under fixtures/cache/ on the
+first run and replay them offline afterwards (default: off).
 """
 
+import atexit
+import datetime
+import hashlib
 import os
 import unittest
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+from playwright.sync_api import (
+    Browser,
+    BrowserContext,
+    Error,
+    FilePayload,
+    Page,
+    Playwright,
+    Route,
+    sync_playwright,
+)
+
+from tests.ui.mock_responses import fulfill_stub
+
+# Recorded upload responses, keyed by a hash of endpoint + uploaded file
+VCR_CACHE_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "cache")
+
+# Process-wide Playwright session shared by every test class
+_playwright: Optional[Playwright] = None
+_browsers: Dict[str, Browser] = {}
+
+
+def _launch_browser(playwright: Playwright, name: str, headless: bool) -> Browser:
+    """Launch a single browser by its configured name."""
+    if name == "firefox":
+        return playwright.firefox.launch(headless=headless)
+    if name in {"edge", "msedge"}:
+        return playwright.chromium.launch(channel="msedge", headless=headless)
+    if name in {"chrome", "google-chrome"}:
+        return playwright.chromium.launch(channel="chrome", headless=headless)
+    # Default to Chromium
+    return playwright.chromium.launch(headless=headless)
+
+
+def _shared_browsers(names: List[str], headless: bool) -> Dict[str, Browser]:
+    """Return launched browsers for the given names, reusing earlier launches."""
+    global _playwright
+    if _playwright is None:
+        _playwright = sync_playwright().start()
+        atexit.register(_stop_shared_browsers)
+    for name in names:
+        if name not in _browsers:
+            _browsers[name] = _launch_browser(_playwright, name, headless)
+    return {name: _browsers[name] for name in names}
+
+
+def _stop_shared_browsers() -> None:
+    """Close shared browsers and stop Playwright at interpreter exit."""
+    global _playwright
+    for browser in _browsers.values():
+        try:
+            browser.close()
+        except Exception:
+            pass
+    _browsers.clear()
+    if _playwright:
+        try:
+            _playwright.stop()
+        except Exception:
+            pass
+        _playwright = None
+
+
+def _read_fixture(path: str, mime_type: str) -> FilePayload:
+    """Read a fixture file once into an in-memory upload payload."""
+    with open(path, "rb") as fixture:
+        return {"name": os.path.basename(path), "mimeType": mime_type, "buffer": fixture.read()}
+
+
+def _upload_cache_key(route: Route) -> str:
+    """Hash the upload endpoint and body, ignoring the random multipart boundary."""
+    request = route.request
+    body = request.post_data_buffer or b""
+    content_type = request.headers.get("content-type", "")
+    if "boundary=" in content_type:
+        boundary = content_type.split("boundary=", 1)[1].split(";", 1)[0].strip('"')
+        body = body.replace(boundary.encode(), b"")
+    path = request.url.split("?", 1)[0].rsplit("/upload/", 1)[-1]
+    return hashlib.sha256(path.encode() + b"\0" + body).hexdigest()
 
-from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+
+def _replay_upload(route: Route) -> None:
+    """Serve a recorded upload response, or record it from the backend on a miss."""
+    if route.request.method != "POST":
+        route.continue_()
+        return
+    cache_path = os.path.join(VCR_CACHE_DIR, f"{_upload_cache_key(route)}.json")
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as cached:
+            route.fulfill(status=200, content_type="application/json", body=cached.read())
+        return
+    try:
+        # Same allowance as an unrecorded upload; Playwright's default is 30 s
+        response = route.fetch(timeout=BaseUITest.API_TIMEOUT)
+    except Error:
+        # Resolve the request so the page reports the failure right away
+        route.abort()
+        return
+    if response.ok:
+        os.makedirs(VCR_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "wb") as cached:
+            cached.write(response.body())
+    route.fulfill(response=response)
 
 
 class BaseUITest(unittest.TestCase):
     """Base class for all UI tests providing browser setup.
     
-    Tests call real backend API - no mocking. The backend must be running
-    at localhost:8000 and the frontend at localhost:3000.
+    Happy flows call the real backend API; validation tests stub the upload
+    response with stub_upload. The backend must be running at localhost:8000
+    and the frontend at localhost:3000.
+
+    Browsers are launched once per process and shared by all test classes;
+    they are closed when the interpreter exits.
     """
 
     # Class-level browser instances
     playwright: Optional[Playwright] = None
     browsers: Dict[str, Browser] = {}
+    contexts: Dict[str, BrowserContext] = {}
     base_url: str = ""
     backend_url: str = ""
     headless: bool = True
+    vcr_mode: str = "off"
     browser_names: list = []
 
-    # Fixture paths
-    invoice_pdf: str = ""
-    po_pdf: str = ""
+    # Fixture files (PDFs are preloaded as in-memory payloads)
+    invoice_pdf: Optional[FilePayload] = None
+    po_pdf: Optional[FilePayload] = None
     invalid_txt: str = ""
     invalid_xlsx: str = ""
+    default_delivery_date: str = ""
+
+    # Viewport for every browser context
+    VIEWPORT: Dict[str, int] = {"width": 1280, "height": 720}
 
     # Longer timeouts for real API calls
     API_TIMEOUT: int = 60000  # 60 seconds for API responses
@@ -42,71 +161,83 @@ class BaseUITest(unittest.TestCase):
         cls.base_url = os.getenv("BASE_URL", "http://localhost:3000")
         cls.backend_url = os.getenv("BACKEND_URL", "http://localhost:8000")
         cls.headless = os.getenv("HEADLESS", "false").lower() in {"1", "true", "yes"}
+        cls.vcr_mode = os.getenv("VCR_MODE", "off").lower()
         browsers_env = os.getenv("BROWSERS", "chromium")
         cls.browser_names = [b.strip().lower() for b in browsers_env.split(",") if b.strip()]
 
-        # Start Playwright
-        cls.playwright = sync_playwright().start()
-        cls.browsers = {}
-
-        # Launch browsers based on configuration
-        for name in cls.browser_names:
-            if name == "firefox":
-                cls.browsers[name] = cls.playwright.firefox.launch(headless=cls.headless)
-            elif name in {"edge", "msedge"}:
-                cls.browsers[name] = cls.playwright.chromium.launch(
-                    channel="msedge", headless=cls.headless
-                )
-            elif name in {"chrome", "google-chrome"}:
-                cls.browsers[name] = cls.playwright.chromium.launch(
-                    channel="chrome", headless=cls.headless
-                )
-            else:
-                # Default to Chromium
-                cls.browsers[name] = cls.playwright.chromium.launch(headless=cls.headless)
-
-        # Set up fixture paths
+        # Reuse browsers already launched by earlier test classes
+        cls.browsers = _shared_browsers(cls.browser_names, cls.headless)
+        cls.playwright = _playwright
+
+        # One context per browser, reused by every test in the class
+        cls.contexts = {
+            name: cls._new_context(browser) for name, browser in cls.browsers.items()
+        }
+
+        # Set up fixture files
         fixtures_dir = os.path.join(os.path.dirname(__file__), "fixtures")
-        cls.invoice_pdf = os.path.join(fixtures_dir, "sample_invoice.pdf")
-        cls.po_pdf = os.path.join(fixtures_dir, "sample_po.pdf")
+        cls.invoice_pdf = _read_fixture(
+            os.path.join(fixtures_dir, "sample_invoice.pdf"), "application/pdf"
+        )
+        cls.po_pdf = _read_fixture(os.path.join(fixtures_dir, "sample_po.pdf"), "application/pdf")
         cls.invalid_txt = os.path.join(fixtures_dir, "invalid.txt")
         cls.invalid_xlsx = os.path.join(fixtures_dir, "invalid.xlsx")
 
+        # Valid delivery date (one week out) for forms that require one
+        cls.default_delivery_date = (
+            datetime.date.today() + datetime.timedelta(days=7)
+        ).strftime("%Y-%m-%d")
+
+    @classmethod
+    def _new_context(cls, browser: Browser) -> BrowserContext:
+        """Create a browser context, with upload replay installed if VCR_MODE=cache."""
+        context = browser.new_context(viewport=cls.VIEWPORT)
+        if cls.vcr_mode == "cache":
+            context.route("**/upload/*", _replay_upload)
+        return context
+
     @classmethod
     def tearDownClass(cls) -> None:
-        """Clean up browsers after all tests in the class."""
-        for browser in cls.browsers.values():
+        """Close the browser contexts created for this test class."""
+        for context in cls.contexts.values():
             try:
-                browser.close()
-            except Exception:
-                pass
-        if cls.playwright:
-            try:
-                cls.playwright.stop()
+                context.close()
             except Exception:
                 pass
+        cls.contexts = {}
+
+    @staticmethod
+    def stub_upload(page: Page, document_type: str) -> None:
+        """Fulfill /upload/<document_type> on this page with its canned JSON body.
+
+        For tests that only exercise client-side validation and do not need
+        real extraction results.
+        """
+        page.route(f"**/upload/{document_type}", fulfill_stub)
 
     def run_in_browsers(self, test_func) -> None:
         """
         Run a test function in all configured browsers.
         
+        Each run gets a new page in the class-level context for that browser;
+        cookies and permissions are reset so tests do not leak state.
+        
         Args:
             test_func: A function that takes (page, browser_name) as arguments
         """
-        for name, browser in self.browsers.items():
+        for name, context in self.contexts.items():
             with self.subTest(browser=name):
-                context: BrowserContext = browser.new_context(
-                    viewport={"width": 1280, "height": 720}
-                )
+                context.clear_cookies()
+                context.clear_permissions()
                 page: Page = context.new_page()
                 
                 # Set longer timeouts for real API calls
                 page.set_default_timeout(self.API_TIMEOUT)
                 page.set_default_navigation_timeout(self.API_TIMEOUT)
                 
-                # No mocking - tests use real backend API
+                # Real backend unless the test stubs uploads (replayed if VCR_MODE=cache)
                 
                 try:
                     test_func(page, name)
                 finally:
-                    context.close()
+                    page.close()
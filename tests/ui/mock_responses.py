@@ -0,0 +1,119 @@
+"""
+Canned backend API payloads for network stubbing in UI tests.
+Bodies are pre-serialized once so route handlers can fulfill them as-is.
+"""
+
+import json
+import re
+
+from playwright.sync_api import Route
+
+
+# ============================================================================
+# Mock API payloads for network stubbing
+# ============================================================================
+
+INVOICE_UPLOAD_RESPONSE = {
+    "confidence": 0.92,
+    "predictionTime": 1.23,
+    "data": {
+        "InvoiceId": "INV-1001",
+        "VendorName": "Acme Supplies",
+        "InvoiceDate": "2025-12-01",
+        "DueDate": "2025-12-15",
+        "BillingAddressRecipient": "Acme Supplies",
+        "ShippingAddress": "123 Road, Metropolis",
+        "Currency": "USD",
+        "SubTotal": 100.0,
+        "ShippingCost": 10.0,
+        "Tax": 5.0,
+        "InvoiceTotal": 115.0,
+        "Items": [
+            {
+                "description": "Widget A",
+                "category": "Widgets",
+                "quantity": 2,
+                "rate": 50.0,
+                "amount": 100.0
+            }
+        ]
+    }
+}
+
+PO_UPLOAD_RESPONSE = {
+    "po_number": "PO-2001",
+    "date": "2025-12-05",
+    "delivery_date": "2025-12-20",
+    "supplier_name": "Global Parts",
+    "company_name": "My Company",
+    "currency": "USD",
+    "total_amount": 500.0,
+    "status": "Draft",
+    "items": [
+        {
+            "item_code": "ITEM-001",
+            "item_name": "Bolt",
+            "description": "Bolt",
+            "quantity": 10,
+            "unit_price": 5.0,
+            "total": 50.0
+        }
+    ]
+}
+
+COMPANY_RESPONSE = {"success": True, "data": {"default_currency": "USD"}}
+
+INVOICE_SUBMIT_RESPONSE = {
+    "invoice_name": "SINV-0001",
+    "invoice_data": {"name": "SINV-0001"},
+    "status_log": ["Created invoice"]
+}
+
+PO_SUBMIT_RESPONSE = {
+    "po_name": "PO-0001",
+    "po_data": {"name": "PO-0001"},
+    "status_log": ["Created PO"]
+}
+
+
+def _json_body(payload: dict) -> bytes:
+    """Serialize a stub payload once into compact JSON bytes."""
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+# Pre-serialized bodies handed to route.fulfill() as-is
+INVOICE_UPLOAD_BODY = _json_body(INVOICE_UPLOAD_RESPONSE)
+PO_UPLOAD_BODY = _json_body(PO_UPLOAD_RESPONSE)
+COMPANY_BODY = _json_body(COMPANY_RESPONSE)
+INVOICE_SUBMIT_BODY = _json_body(INVOICE_SUBMIT_RESPONSE)
+PO_SUBMIT_BODY = _json_body(PO_SUBMIT_RESPONSE)
+
+
+# ============================================================================
+# Stubbed API routes
+# ============================================================================
+
+# Single matcher for every stubbed endpoint, equivalent to the globs
+# **/upload/{invoice,po}, **/erpnext/{sales-invoice,purchase-order} and
+# **/erpnext/company/**; the captured path selects the body
+STUB_ROUTE_PATTERN = re.compile(
+    r"/(?:(upload/(?:invoice|po)|erpnext/(?:sales-invoice|purchase-order))|(erpnext/company)/.*)$"
+)
+STUB_BODIES = {
+    "upload/invoice": INVOICE_UPLOAD_BODY,
+    "upload/po": PO_UPLOAD_BODY,
+    "erpnext/company": COMPANY_BODY,
+    "erpnext/sales-invoice": INVOICE_SUBMIT_BODY,
+    "erpnext/purchase-order": PO_SUBMIT_BODY,
+}
+
+
+def fulfill_stub(route: Route) -> None:
+    """Fulfill a stubbed API request with its pre-serialized body."""
+    # Only routed for URLs that match STUB_ROUTE_PATTERN
+    match = STUB_ROUTE_PATTERN.search(route.request.url)
+    route.fulfill(
+        status=200,
+        content_type="application/json",
+        body=STUB_BODIES[match.group(1) or match.group(2)]
+    )
@@ -0,0 +1,25 @@
+"""In-page JavaScript shared by the form page objects."""
+
+# Form is rendered once the submit button is visible and backend data has been
+# filled into the first line item; field values are left to test assertions
+FORM_READY_JS = """() => {
+    const isVisible = (el) => {
+        const box = el.getBoundingClientRect();
+        return box.width > 0 && box.height > 0
+            && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const submit = Array.from(document.querySelectorAll('button'))
+        .some((b) => b.textContent.includes('Submit to ERPNext') && isVisible(b));
+    const firstItem = document.querySelector('table tbody tr input');
+    return submit && !!firstItem?.value;
+}"""
+
+# Read the first line item row in one round trip. Takes a mapping of column
+# name to input index and returns every column, '' when the row is missing.
+FIRST_ROW_VALUES_JS = """(columns) => {
+    const row = document.querySelector('table tbody tr');
+    const inputs = row ? row.querySelectorAll('input') : [];
+    return Object.fromEntries(
+        Object.entries(columns).map(([name, index]) => [name, inputs[index]?.value ?? ''])
+    );
+}"""
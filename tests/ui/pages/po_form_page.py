@@ -3,8 +3,21 @@
 Uses real backend API data - form fields populated from actual API response.
 """
 
-from typing import Dict
-from playwright.sync_api import Page, expect
+from typing import Dict, Tuple
+from playwright.sync_api import Locator, Page
+
+from tests.ui.pages.form_scripts import FIRST_ROW_VALUES_JS, FORM_READY_JS
+
+# Header field ids, matching the inputs' name attributes
+_FIELD_IDS: Tuple[str, ...] = (
+    "supplier_name",
+    "company_name",
+    "order_date",
+    "delivery_date",
+    "currency",
+)
+# Line item column names mapped to their input index within a row
+_COLUMN_MAP: Dict[str, int] = {"item_code": 0, "description": 1, "quantity": 2, "unit_price": 3}
 
 
 class POFormPage:
@@ -13,6 +26,8 @@ class POFormPage:
     # Longer timeouts for real API data
     FORM_TIMEOUT = 30000  # 30 seconds for form to be filled
     API_TIMEOUT = 60000   # 60 seconds for API calls
+    # Field access once wait_for_form() has confirmed the form is populated
+    DEFAULT_AFTER_READY_TIMEOUT = 500
 
     def __init__(self, page: Page) -> None:
         """Initialize the PO form page object."""
@@ -22,66 +37,40 @@ class POFormPage:
         self.error_message = page.locator("div.bg-red-50 p")
         # Success message can appear in either format
         self.success_message = page.locator("div.bg-green-50 h3, div.bg-green-50 p")
+        # Inputs of the first line item row, resolved lazily by Playwright
+        self.first_item_inputs = page.locator("table tbody tr").first.locator("input")
 
-        # Field label mappings for locator resolution
-        self.field_map: Dict[str, str] = {
-            "supplier_name": "Supplier Name",
-            "company_name": "Company Name",
-            "order_date": "Order Date",
-            "delivery_date": "Delivery Date",
-            "currency": "Currency",
+        # Field locators built once; Playwright resolves them lazily on use
+        self.field_locators: Dict[str, Locator] = {
+            field_id: page.locator(f"[name='{field_id}']") for field_id in _FIELD_IDS
         }
 
     def wait_for_form(self) -> None:
         """Wait for the PO form to be fully loaded with data from backend."""
-        # Wait for form header to appear
-        self.page.wait_for_selector("text=Purchase Order Form", timeout=self.FORM_TIMEOUT)
-        # Wait for submit button to be visible
-        self.submit_button.wait_for(state="visible", timeout=self.FORM_TIMEOUT)
-        # Wait for items table to have at least one row (form is filled)
-        self.page.wait_for_selector("table tbody tr", timeout=self.FORM_TIMEOUT)
-        # Small delay to ensure form is fully rendered
-        self.page.wait_for_timeout(1000)
-
-    def _get_field_locator(self, label_text: str):
-        """Get input/select locator by its associated label text."""
-        return self.page.locator(
-            f"div:has(> label:has-text('{label_text}')) input, "
-            f"div:has(> label:has-text('{label_text}')) select"
-        )
+        # Single in-page predicate: submit button visible and first item row
+        # populated from the backend response
+        self.page.wait_for_function(FORM_READY_JS, timeout=self.FORM_TIMEOUT, polling=100)
 
     def get_field_value(self, field_id: str) -> str:
         """Get the current value of a form field."""
-        label_text = self.field_map[field_id]
-        locator = self._get_field_locator(label_text)
-        locator.first.wait_for(state="visible", timeout=5000)
-        return locator.first.input_value()
+        return self.field_locators[field_id].input_value(timeout=self.DEFAULT_AFTER_READY_TIMEOUT)
 
     def set_field_value(self, field_id: str, value: str) -> None:
         """Set a value in a form field."""
-        label_text = self.field_map[field_id]
-        field = self._get_field_locator(label_text).first
-        field.wait_for(state="visible", timeout=5000)
-        field.clear()
-        field.fill(value)
+        # fill() waits for the field and replaces its current value
+        self.field_locators[field_id].fill(value, timeout=self.DEFAULT_AFTER_READY_TIMEOUT)
 
     def clear_field(self, field_id: str) -> None:
         """Clear a form field."""
-        label_text = self.field_map[field_id]
-        field = self._get_field_locator(label_text).first
-        field.wait_for(state="visible", timeout=5000)
-        field.clear()
+        self.field_locators[field_id].clear(timeout=self.DEFAULT_AFTER_READY_TIMEOUT)
 
     def click_edit(self) -> None:
         """Click on an editable field to enter edit mode."""
-        field = self._get_field_locator("Supplier Name").first
-        field.wait_for(state="visible", timeout=5000)
-        field.click()
+        self.field_locators["supplier_name"].click(timeout=self.DEFAULT_AFTER_READY_TIMEOUT)
 
     def submit_form(self) -> None:
         """Click the submit button."""
-        expect(self.submit_button).to_be_visible(timeout=5000)
-        self.submit_button.click()
+        self.submit_button.click(timeout=5000)
 
     def get_error_text(self) -> str:
         """Get the validation error message text."""
@@ -100,21 +89,16 @@ class POFormPage:
         # Get the full text content from the success container
         return success_container.first.inner_text()
 
+    def get_first_row_values(self) -> Dict[str, str]:
+        """Get all values of the first line item row in a single round trip."""
+        return self.page.evaluate(FIRST_ROW_VALUES_JS, _COLUMN_MAP)
+
     def get_first_item_field(self, field_name: str) -> str:
         """Get the value of a field in the first line item row."""
-        row = self.page.locator("table tbody tr").first
-        column_map = {"item_code": 0, "description": 1, "quantity": 2, "unit_price": 3}
-        index = column_map[field_name]
-        cell_input = row.locator("input").nth(index)
-        cell_input.wait_for(state="visible", timeout=5000)
-        return cell_input.input_value()
+        cell_input = self.first_item_inputs.nth(_COLUMN_MAP[field_name])
+        return cell_input.input_value(timeout=self.DEFAULT_AFTER_READY_TIMEOUT)
 
     def set_first_item_field(self, field_name: str, value: str) -> None:
         """Set a value in the first line item row."""
-        row = self.page.locator("table tbody tr").first
-        column_map = {"item_code": 0, "description": 1, "quantity": 2, "unit_price": 3}
-        index = column_map[field_name]
-        cell_input = row.locator("input").nth(index)
-        cell_input.wait_for(state="visible", timeout=5000)
-        cell_input.clear()
-        cell_input.fill(value)
+        cell_input = self.first_item_inputs.nth(_COLUMN_MAP[field_name])
+        cell_input.fill(value, timeout=self.DEFAULT_AFTER_READY_TIMEOUT)
@@ -1,9 +1,12 @@
 """Page Object for Invoice Upload functionality.
 
-Uses real backend API at localhost:8000 - no mocking.
+Uploads go to the real backend API at localhost:8000 unless the test stubs
+the upload response (see BaseUITest.stub_upload).
 """
 
-from playwright.sync_api import Page, expect
+from typing import Union
+
+from playwright.sync_api import FilePayload, Page
 
 
 class UploadInvoicePage:
@@ -19,25 +22,25 @@ class UploadInvoicePage:
         self.file_input = page.locator("#fileUpload")
         self.upload_button = page.locator("button:has-text('Upload & Process')")
         self.error_message = page.locator("div.bg-red-50 p")
-        # Loading indicator to know when API call is in progress
-        self.loading_indicator = page.locator("text=Processing").or_(page.locator("text=Uploading"))
 
     def go_to_page(self, url: str) -> None:
         """Navigate to the upload page and wait for it to load."""
-        self.page.goto(url, wait_until="networkidle", timeout=30000)
+        # "load" waits for the Next.js bundles, so React has hydrated the select;
+        # domcontentloaded can return while its onChange is not yet attached
+        self.page.goto(url, wait_until="load", timeout=30000)
         self.document_type_select.wait_for(state="visible", timeout=10000)
 
-    def upload_pdf(self, file_path: str) -> None:
-        """Select invoice type, upload a PDF, click upload button, and wait for API response."""
+    def upload_pdf(self, pdf_file: Union[str, FilePayload]) -> None:
+        """Select invoice type, upload a PDF, click upload button, and wait for API response.
+
+        Accepts a file path or an in-memory payload (name, mimeType, buffer).
+        """
         # Select document type
         self.document_type_select.select_option("invoice")
-        # Wait for file input to be ready
-        self.file_input.wait_for(state="attached", timeout=5000)
-        # Set the file
-        self.file_input.set_input_files(file_path)
-        # Wait for upload button to be enabled and click
-        expect(self.upload_button).to_be_enabled(timeout=5000)
-        self.upload_button.click()
+        # Set the file (set_input_files waits for the input itself)
+        self.file_input.set_input_files(pdf_file)
+        # click() auto-waits for the upload button to become enabled
+        self.upload_button.click(timeout=5000)
         
         # Wait for real API response - the form should appear when done
         # Wait for the Invoice Preview header to appear
@@ -49,7 +52,6 @@ class UploadInvoicePage:
     def upload_invalid_file(self, file_path: str) -> None:
         """Upload an invalid file type to trigger validation error."""
         self.document_type_select.select_option("invoice")
-        self.file_input.wait_for(state="attached", timeout=5000)
         self.file_input.set_input_files(file_path)
 
     def get_upload_error_text(self) -> str:
@@ -1,7 +1,8 @@
 """End-to-end UI tests for Invoice flow.
 
-Tests use real backend API at localhost:8000 - no mocking.
-The form is filled with real data from the Document Intelligence API.
+The happy flow uses the real backend API at localhost:8000 - the form is
+filled with real data from the Document Intelligence API. Validation tests
+stub the upload response, since they only exercise client-side checks.
 
 Tests cover:
 - Happy flow: Upload PDF, verify form is filled, edit, submit
@@ -43,8 +44,8 @@ class TestInvoiceFlow(BaseUITest):
             self.assertTrue(len(customer_name) > 0, "Customer name should be filled from API")
             
             # Verify items table has data
-            first_item_desc = form.get_first_item_field("description")
-            self.assertTrue(len(first_item_desc) > 0, "First item description should be filled")
+            first_row = form.get_first_row_values()
+            self.assertTrue(len(first_row["description"]) > 0, "First item description should be filled")
 
             # Step 5: Submit form and verify success
             form.submit_form()
@@ -53,7 +54,7 @@ class TestInvoiceFlow(BaseUITest):
             page.wait_for_selector("div.bg-green-50, div.bg-red-50", timeout=60000)
             
             # Check if success message appeared
-            if page.locator("div.bg-green-50").count() > 0:
+            if page.locator("div.bg-green-50").first.is_visible():
                 success_text = form.get_success_text()
                 self.assertTrue(
                     "Sales Invoice created" in success_text or
@@ -92,6 +93,9 @@ class TestInvoiceFlow(BaseUITest):
         """Test that missing required fields shows validation error."""
 
         def run(page, _browser_name: str) -> None:
+            # Stub extraction - only client-side validation is under test
+            self.stub_upload(page, "invoice")
+
             # Navigate and upload valid PDF
             upload_page = UploadInvoicePage(page)
             upload_page.go_to_page(self.base_url)
@@ -120,6 +124,9 @@ class TestInvoiceFlow(BaseUITest):
         """Test that invalid field values show validation error."""
 
         def run(page, _browser_name: str) -> None:
+            # Stub extraction - only client-side validation is under test
+            self.stub_upload(page, "invoice")
+
             # Navigate and upload valid PDF
             upload_page = UploadInvoicePage(page)
             upload_page.go_to_page(self.base_url)
@@ -1,7 +1,8 @@
 """End-to-end UI tests for Purchase Order flow.
 
-Tests use real backend API at localhost:8000 - no mocking.
-The form is filled with real data from the Document Intelligence API.
+The happy flow uses the real backend API at localhost:8000 - the form is
+filled with real data from the Document Intelligence API. Validation tests
+stub the upload response, since they only exercise client-side checks.
 
 Tests cover:
 - Happy flow: Upload PDF, verify form is filled, edit, submit
@@ -43,16 +44,14 @@ class TestPOFlow(BaseUITest):
             self.assertTrue(len(supplier_name) > 0, "Supplier name should be filled from API")
             
             # Verify items table has data
-            first_item_code = form.get_first_item_field("item_code")
-            self.assertTrue(len(first_item_code) > 0, "First item code should be filled")
+            first_row = form.get_first_row_values()
+            self.assertTrue(len(first_row["item_code"]) > 0, "First item code should be filled")
 
             # Step 4b: Ensure delivery date is set (required field)
             # Always set a valid delivery date to ensure form submission works
-            import datetime
-            default_date = (datetime.date.today() + datetime.timedelta(days=7)).strftime("%Y-%m-%d")
             # Use direct locator for date input to ensure it works
             delivery_date_input = page.locator("input[type='date']").nth(1)  # Second date input is delivery date
-            delivery_date_input.fill(default_date)
+            delivery_date_input.fill(self.default_delivery_date)
 
             # Step 5: Submit form and verify success
             form.submit_form()
@@ -61,7 +60,7 @@ class TestPOFlow(BaseUITest):
             page.wait_for_selector("div.bg-green-50, div.bg-red-50", timeout=60000)
             
             # Check if success message appeared
-            if page.locator("div.bg-green-50").count() > 0:
+            if page.locator("div.bg-green-50").first.is_visible():
                 success_text = form.get_success_text()
                 self.assertTrue(
                     "Purchase Order created" in success_text or
@@ -100,6 +99,9 @@ class TestPOFlow(BaseUITest):
         """Test that missing required fields shows validation error."""
 
         def run(page, _browser_name: str) -> None:
+            # Stub extraction - only client-side validation is under test
+            self.stub_upload(page, "po")
+
             # Navigate and upload valid PDF
             upload_page = UploadPOPage(page)
             upload_page.go_to_page(self.base_url)
@@ -125,6 +127,9 @@ class TestPOFlow(BaseUITest):
         """Test that invalid field values show validation error."""
 
         def run(page, _browser_name: str) -> None:
+            # Stub extraction - only client-side validation is under test
+            self.stub_upload(page, "po")
+
             # Navigate and upload valid PDF
             upload_page = UploadPOPage(page)
             upload_page.go_to_page(self.base_url)